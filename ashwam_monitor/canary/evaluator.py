@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Iterable, Tuple
 from ..models.inputs import ParserItem, GoldItem
 
 
@@ -21,23 +21,27 @@ def compute_precision_recall_f1(matched: int, missed: int, extra: int) -> Tuple[
 
 
 def compute_evidence_match_rate(
-    parser_items: List[ParserItem],
-    gold_items: List[GoldItem]
+    parser_items: Iterable[ParserItem],
+    gold_items: Iterable[GoldItem]
 ) -> float:
     """
     how many parser items have evidence that matches gold
     this is about span grounding not just count
+    accepts any iterables and accumulates in a single streaming pass
     """
-    if not parser_items or not gold_items:
+    # normalize gold spans once instead of per parser item
+    gold_spans = [g.evidence_span.lower().strip() for g in gold_items]
+    if not gold_spans:
         return 0.0
 
     matched = 0
+    total = 0
     for pitem in parser_items:
+        total += 1
         p_span = pitem.evidence_span.lower().strip()
-        for gitem in gold_items:
-            g_span = gitem.evidence_span.lower().strip()
+        for g_span in gold_spans:
             if p_span == g_span or p_span in g_span or g_span in p_span:
                 matched += 1
                 break
 
-    return matched / len(parser_items)
+    return matched / total if total else 0.0
@@ -6,13 +6,23 @@ import uuid
 from ..models.inputs import ParserOutput, GoldLabel
 from ..models.outputs import CanaryReport, CanaryJournalResult
 from ..config import config
-from ..io.loader import load_parser_outputs, load_gold_labels
+from ..io.loader import load_jsonl_many
 
 from .matcher import match_items
 from .evaluator import compute_precision_recall_f1, compute_evidence_match_rate
 from .actions import determine_action
 
 
+def filter_canary_outputs(
+    outputs: List[ParserOutput],
+    gold_labels: List[GoldLabel]
+) -> List[ParserOutput]:
+    # keep only outputs for journals that have gold labels
+    # frozenset gives a stable, cheap membership probe for the single pass
+    canary_ids = frozenset(g.journal_id for g in gold_labels)
+    return [o for o in outputs if o.journal_id in canary_ids]
+
+
 def run_canary_evaluation(
     parser_outputs: List[ParserOutput],
     gold_labels: List[GoldLabel]
@@ -22,17 +32,19 @@ def run_canary_evaluation(
     """
     run_id = f"canary-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
 
-    # build lookup by journal_id
+    # single lookup by journal_id; gold labels drive the loop directly
     parser_by_id = {o.journal_id: o for o in parser_outputs}
-    gold_by_id = {g.journal_id: g for g in gold_labels}
 
     total_matched = 0
     total_missed = 0
     total_extra = 0
     per_journal = []
+    # parser items for journals that have gold labels, collected during the
+    # merge so no second scan over parser_outputs is needed
+    gold_parser_items = []
 
-    for journal_id in gold_by_id:
-        gold = gold_by_id[journal_id]
+    for gold in gold_labels:
+        journal_id = gold.journal_id
         parser = parser_by_id.get(journal_id)
 
         if parser is None:
@@ -49,6 +61,7 @@ def run_canary_evaluation(
             total_missed += missed
             continue
 
+        gold_parser_items.extend(parser.items)
         matched, missed, extra = match_items(parser.items, gold.items)
         total_matched += matched
         total_missed += missed
@@ -66,36 +79,32 @@ def run_canary_evaluation(
     # compute overall metrics
     precision, recall, f1 = compute_precision_recall_f1(total_matched, total_missed, total_extra)
 
-    # evidence match rate across all items
-    all_parser_items = [item for o in parser_outputs for item in o.items if o.journal_id in gold_by_id]
-    all_gold_items = [item for g in gold_labels for item in g.items]
-    evidence_rate = compute_evidence_match_rate(all_parser_items, all_gold_items)
+    # evidence match rate across all items - gold side streams as a generator
+    evidence_rate = compute_evidence_match_rate(
+        gold_parser_items,
+        (item for g in gold_labels for item in g.items)
+    )
 
     # determine action
     action, reason = determine_action(f1, evidence_rate)
 
     thresholds = config.canary
+    r = round
 
     return CanaryReport(
         timestamp=datetime.now(),
         run_id=run_id,
-        precision=round(precision, 3),
-        recall=round(recall, 3),
-        f1=round(f1, 3),
-        evidence_match_rate=round(evidence_rate, 3),
+        precision=r(precision, 3),
+        recall=r(recall, 3),
+        f1=r(f1, 3),
+        evidence_match_rate=r(evidence_rate, 3),
         matched_count=total_matched,
         missed_count=total_missed,
         extra_count=total_extra,
         action=action,
         action_reason=reason,
         per_journal=per_journal,
-        thresholds_used={
-            "f1_pass": thresholds.f1_pass,
-            "f1_alert": thresholds.f1_alert,
-            "f1_human_review": thresholds.f1_human_review,
-            "f1_rollback": thresholds.f1_rollback,
-            "min_evidence_match": thresholds.min_evidence_match
-        },
+        thresholds_used=thresholds.thresholds_used,
         threshold_rationale=thresholds.threshold_rationale,
         run_frequency=thresholds.run_frequency
     )
@@ -108,6 +117,8 @@ def run_canary_from_paths(
     """
     convenience function to run canary from file paths
     """
-    outputs, _ = load_parser_outputs(parser_outputs_path)
-    gold, _ = load_gold_labels(canary_gold_path)
+    (outputs, _), (gold, _) = load_jsonl_many([
+        (parser_outputs_path, ParserOutput),
+        (canary_gold_path, GoldLabel),
+    ])
     return run_canary_evaluation(outputs, gold)
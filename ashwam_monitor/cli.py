@@ -3,42 +3,84 @@ from pathlib import Path
 import sys
 from functools import wraps
 
-from .io.loader import load_parser_outputs, load_journals_as_dict, load_gold_labels
-from .io.writer import write_invariant_report, write_drift_report, write_canary_report, write_summary_report
-from .invariants.runner import run_invariant_checks
-from .metrics.comparator import run_drift_analysis
-from .canary.runner import run_canary_evaluation
-from .explainability.pm_view import generate_pm_view
+# heavy submodules (numpy/scipy/jinja2 transitively) are imported inside the
+# subcommand that needs them so --help and single-purpose commands start fast
 from .exceptions import AshwamMonitorError, DataLoadError
 
 
 def handle_errors(func):
-    # decorator to catch errors and show friendly messages
+    # decorator to catch errors and show friendly messages. re-raising as
+    # ClickException lets click's own reporter print and exit(1) without the
+    # echo + sys.exit double formatting. applied only to top-level commands -
+    # inner helpers shouldn't pay for an extra try frame per call
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except DataLoadError as e:
-            click.echo(f"error loading file: {e}", err=True)
-            sys.exit(1)
+            raise click.ClickException(f"error loading file: {e}")
         except AshwamMonitorError as e:
-            click.echo(f"error: {e}", err=True)
-            sys.exit(1)
+            raise click.ClickException(str(e))
         except Exception as e:
-            click.echo(f"unexpected error: {e}", err=True)
-            sys.exit(1)
+            raise click.ClickException(f"unexpected error: {e}")
     return wrapper
 
 
+def _dashboard_digest(invariant, drift, canary):
+    # stable fingerprint of everything the PM dashboard renders except the
+    # timestamp - re-runs over identical data map to the same digest
+    import hashlib
+
+    fingerprint = repr((
+        invariant.hallucination_rate,
+        invariant.contradiction_rate,
+        invariant.schema_validity_rate,
+        invariant.evidence_validity_rate,
+        tuple(invariant.alerts),
+        tuple((m.name, m.current_value, m.status.value) for m in drift.metrics) if drift else None,
+        tuple(drift.alerts) if drift else None,
+        (canary.f1, canary.action.value) if canary else None,
+    ))
+    return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class BufferedEcho:
+    # coalesce stdout echoes into a single write when output is piped or
+    # redirected; interactive terminals still stream line by line.
+    # use as a context manager so buffered lines flush even on errors
+    def __init__(self):
+        self._lines = []
+        self._interactive = sys.stdout.isatty()
+
+    def __call__(self, msg=""):
+        if self._interactive:
+            click.echo(msg)
+        else:
+            self._lines.append(msg)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
+
+
 @click.group()
 @click.version_option(version="1.0.0", prog_name="ashwam-monitor")
 def cli():
     """
     ashwam production monitoring tool
-    
+
     detects model drift and unsafe behavior in journal parser outputs
     without requiring ground truth labels
-    
+
     example: python -m ashwam_monitor run --data ./data --out ./out
     """
     pass
@@ -56,7 +98,7 @@ def cli():
 @click.option("--verbose", "-v", is_flag=True, help="show debug info")
 @click.option("--format", "-f", type=click.Choice(["json", "markdown"]), default="json",
               help="output format: json (default) or markdown (PM view)")
-@click.option("--dry-run", is_flag=True, 
+@click.option("--dry-run", is_flag=True,
               help="preview mode: run all checks but don't write files")
 @click.option("--log", is_flag=True,
               help="enable file logging to out/logs/")
@@ -65,114 +107,140 @@ def cli():
 @handle_errors
 def run(data, out, baseline, current, verbose, format, dry_run, log, store_history):
     """run complete monitoring suite"""
+    from concurrent.futures import ProcessPoolExecutor
+
     from .logging_config import setup_logging, get_logger
     from .storage import RunHistoryDB
-    
+    from .io.loader import load_gold_labels, load_jsonl_many
+    from .io.writer import write_invariant_report, write_drift_report, write_canary_report, write_summary_report
+    from .models.inputs import JournalEntry, ParserOutput
+    from .invariants.runner import run_invariant_checks
+    from .metrics.comparator import run_drift_analysis
+    from .canary.runner import run_canary_evaluation, filter_canary_outputs
+    from .explainability.pm_view import generate_pm_view
+
     data_path = Path(data)
     out_path = Path(out)
+    # derived paths built once up front - every / allocates a fresh PurePath
+    journals_path = data_path / "journals.jsonl"
+    baseline_path = data_path / baseline
+    current_path = data_path / current
+    canary_path = data_path / "canary" / "gold.jsonl"
 
     # Setup logging
     log_dir = out_path / "logs" if log else None
     setup_logging(log_dir=log_dir, verbose=verbose)
     logger = get_logger()
-    
-    if dry_run:
-        click.echo("=== DRY RUN MODE (no files will be written) ===\n")
-        logger.info("Starting dry run")
-    
-    click.echo(f"running monitoring on {data_path}")
-    logger.info(f"Data source: {data_path}")
-    
-    if not dry_run:
-        click.echo(f"output to {out_path}")
-
-    # load data
-    journals = load_journals_as_dict(data_path / "journals.jsonl")
-    baseline_outputs, base_errors = load_parser_outputs(data_path / baseline)
-    current_outputs, curr_errors = load_parser_outputs(data_path / current)
-    
-    logger.info(f"Loaded {len(journals)} journals")
-    logger.info(f"Baseline: {len(baseline_outputs)} outputs, {len(base_errors)} errors")
-    logger.info(f"Current: {len(current_outputs)} outputs, {len(curr_errors)} errors")
-
-    if verbose:
-        click.echo(f"loaded {len(journals)} journals")
-        click.echo(f"baseline: {len(baseline_outputs)} outputs, {len(base_errors)} errors")
-        click.echo(f"current: {len(current_outputs)} outputs, {len(curr_errors)} errors")
-
-    # run invariant checks on current
-    click.echo("running invariant checks...")
-    logger.info("Running invariant checks")
-    invariant_report = run_invariant_checks(current_outputs, journals)
-    logger.info(f"Invariants: hallucination={invariant_report.hallucination_rate:.1%}, contradiction={invariant_report.contradiction_rate:.1%}")
-
-    # run drift analysis
-    click.echo("running drift analysis...")
-    logger.info("Running drift analysis")
-    drift_report = run_drift_analysis(baseline_outputs, current_outputs, baseline, current)
-    logger.info(f"Drift: {len(drift_report.alerts)} alerts")
-
-    # run canary if gold labels exist - evaluate CURRENT outputs not baseline
-    canary_path = data_path / "canary" / "gold.jsonl"
-    canary_report = None
-    if canary_path.exists():
-        click.echo("running canary evaluation...")
-        logger.info("Running canary evaluation")
-        gold_labels, _ = load_gold_labels(canary_path)
-        canary_ids = {g.journal_id for g in gold_labels}
-        canary_outputs = [o for o in current_outputs if o.journal_id in canary_ids]
-        canary_report = run_canary_evaluation(canary_outputs, gold_labels)
-        logger.info(f"Canary: F1={canary_report.f1:.1%}, action={canary_report.action.value}")
-
-    # write reports (skip if dry-run)
-    if not dry_run:
-        click.echo("writing reports...")
-        write_invariant_report(invariant_report, out_path)
-        write_drift_report(drift_report, out_path)
+
+    with BufferedEcho() as echo:
+        if dry_run:
+            echo("=== DRY RUN MODE (no files will be written) ===\n")
+            logger.info("Starting dry run")
+
+        echo(f"running monitoring on {data_path}")
+        logger.info(f"Data source: {data_path}")
+
+        if not dry_run:
+            echo(f"output to {out_path}")
+
+        # load data - the three files are independent so decode them in parallel
+        (journal_entries, _), (baseline_outputs, base_errors), (current_outputs, curr_errors) = load_jsonl_many([
+            (journals_path, JournalEntry),
+            (baseline_path, ParserOutput),
+            (current_path, ParserOutput),
+        ])
+        journals = {j.journal_id: j.text for j in journal_entries}
+
+        logger.info(f"Loaded {len(journals)} journals")
+        logger.info(f"Baseline: {len(baseline_outputs)} outputs, {len(base_errors)} errors")
+        logger.info(f"Current: {len(current_outputs)} outputs, {len(curr_errors)} errors")
+
+        if verbose:
+            echo(f"loaded {len(journals)} journals")
+            echo(f"baseline: {len(baseline_outputs)} outputs, {len(base_errors)} errors")
+            echo(f"current: {len(current_outputs)} outputs, {len(curr_errors)} errors")
+
+        # the three analysis stages are independent cpu-bound passes over data
+        # already in memory, so run them in parallel processes (canary only if
+        # gold labels exist - evaluate CURRENT outputs not baseline)
+        echo("running invariant checks, drift analysis and canary evaluation...")
+        logger.info("Running analysis stages in parallel")
+        with ProcessPoolExecutor(max_workers=3) as pool:
+            f_invariant = pool.submit(run_invariant_checks, current_outputs, journals)
+            f_drift = pool.submit(run_drift_analysis, baseline_outputs, current_outputs, baseline, current)
+            f_canary = None
+            if canary_path.exists():
+                gold_labels, _ = load_gold_labels(canary_path)
+                canary_outputs = filter_canary_outputs(current_outputs, gold_labels)
+                f_canary = pool.submit(run_canary_evaluation, canary_outputs, gold_labels)
+
+            invariant_report = f_invariant.result()
+            drift_report = f_drift.result()
+            canary_report = f_canary.result() if f_canary else None
+
+        logger.info(f"Invariants: hallucination={invariant_report.hallucination_rate:.1%}, contradiction={invariant_report.contradiction_rate:.1%}")
+        logger.info(f"Drift: {len(drift_report.alerts)} alerts")
+        if canary_report:
+            logger.info(f"Canary: F1={canary_report.f1:.1%}, action={canary_report.action.value}")
+
+        # write reports (skip if dry-run)
+        if not dry_run:
+            echo("writing reports...")
+            write_invariant_report(invariant_report, out_path)
+            write_drift_report(drift_report, out_path)
+            if canary_report:
+                write_canary_report(canary_report, out_path)
+                write_summary_report(invariant_report, drift_report, canary_report, out_path)
+
+            # generate PM view if markdown format requested - skip the render
+            # and rewrite entirely when a re-run produced identical content,
+            # so file-watchers on dashboard.md don't fire for nothing
+            if format == "markdown":
+                md_path = out_path / "dashboard.md"
+                hash_path = out_path / ".pm_view.hash"
+                digest = _dashboard_digest(invariant_report, drift_report, canary_report)
+                if md_path.exists() and hash_path.exists() and hash_path.read_text() == digest:
+                    echo(f"Dashboard unchanged: {md_path}")
+                else:
+                    pm_view = generate_pm_view(invariant_report, drift_report, canary_report)
+                    md_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(md_path, "w", encoding="utf-8") as f:
+                        f.write(pm_view)
+                    hash_path.write_text(digest)
+                    echo(f"Dashboard written to {md_path}")
+
+            # Store in history database if requested
+            if store_history:
+                history_path = out_path / "run_history.db"
+                db = RunHistoryDB(history_path)
+                db.save_run(
+                    run_id=invariant_report.run_id,
+                    invariant_report=invariant_report,
+                    drift_report=drift_report,
+                    canary_report=canary_report,
+                    data_source=str(data_path)
+                )
+                echo(f"Run saved to history database: {history_path}")
+                logger.info(f"Run {invariant_report.run_id} saved to database")
+
+        # print summary
+        echo("\n=== SUMMARY ===")
+        echo(f"hallucination rate: {invariant_report.hallucination_rate:.1%}")
+        echo(f"contradiction rate: {invariant_report.contradiction_rate:.1%}")
+        echo(f"alerts: {len(invariant_report.alerts)}")
+
+        for alert in invariant_report.alerts[:3]:
+            echo(f"  {alert}")
+            logger.warning(alert)
+
         if canary_report:
-            write_canary_report(canary_report, out_path)
-            write_summary_report(invariant_report, drift_report, canary_report, out_path)
-
-        # generate PM view if markdown format requested
-        if format == "markdown":
-            pm_view = generate_pm_view(invariant_report, drift_report, canary_report)
-            md_path = out_path / "dashboard.md"
-            md_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(pm_view)
-            click.echo(f"Dashboard written to {md_path}")
-        
-        # Store in history database if requested
-        if store_history:
-            db = RunHistoryDB(out_path / "run_history.db")
-            db.save_run(
-                run_id=invariant_report.run_id,
-                invariant_report=invariant_report,
-                drift_report=drift_report,
-                canary_report=canary_report,
-                data_source=str(data_path)
-            )
-            click.echo(f"Run saved to history database: {out_path / 'run_history.db'}")
-            logger.info(f"Run {invariant_report.run_id} saved to database")
-
-    # print summary
-    click.echo("\n=== SUMMARY ===")
-    click.echo(f"hallucination rate: {invariant_report.hallucination_rate:.1%}")
-    click.echo(f"contradiction rate: {invariant_report.contradiction_rate:.1%}")
-    click.echo(f"alerts: {len(invariant_report.alerts)}")
-
-    for alert in invariant_report.alerts[:3]:
-        click.echo(f"  {alert}")
-        logger.warning(alert)
-
-    if canary_report:
-        click.echo(f"\ncanary f1: {canary_report.f1:.1%}")
-        click.echo(f"canary action: {canary_report.action.value}")
-
-    if dry_run:
-        click.echo("\n=== DRY RUN COMPLETE (no files written) ===")
-    else:
-        click.echo(f"\nreports written to {out_path}")
+            echo(f"\ncanary f1: {canary_report.f1:.1%}")
+            echo(f"canary action: {canary_report.action.value}")
+
+        if dry_run:
+            echo("\n=== DRY RUN COMPLETE (no files written) ===")
+        else:
+            echo(f"\nreports written to {out_path}")
 
 
 @cli.command()
@@ -184,6 +252,10 @@ def run(data, out, baseline, current, verbose, format, dry_run, log, store_histo
               help="output directory")
 def invariants(outputs, journals, out):
     """run invariant checks only"""
+    from .io.loader import load_parser_outputs, load_journals_as_dict
+    from .io.writer import write_invariant_report
+    from .invariants.runner import run_invariant_checks
+
     journals_dict = load_journals_as_dict(Path(journals))
     parser_outputs, _ = load_parser_outputs(Path(outputs))
 
@@ -207,6 +279,10 @@ def invariants(outputs, journals, out):
               help="output directory")
 def drift(baseline, current, out):
     """compare drift between two output sets"""
+    from .io.loader import load_parser_outputs
+    from .io.writer import write_drift_report
+    from .metrics.comparator import run_drift_analysis
+
     base_outputs, _ = load_parser_outputs(Path(baseline))
     curr_outputs, _ = load_parser_outputs(Path(current))
 
@@ -231,13 +307,16 @@ def drift(baseline, current, out):
               help="output directory")
 def canary(canary_dir, outputs, out):
     """run canary evaluation against gold labels"""
+    from .io.loader import load_parser_outputs, load_gold_labels
+    from .io.writer import write_canary_report
+    from .canary.runner import run_canary_evaluation, filter_canary_outputs
+
     canary_path = Path(canary_dir)
     gold_labels, _ = load_gold_labels(canary_path / "gold.jsonl")
     parser_outputs, _ = load_parser_outputs(Path(outputs))
 
     # filter to canary journals
-    canary_ids = {g.journal_id for g in gold_labels}
-    canary_outputs = [o for o in parser_outputs if o.journal_id in canary_ids]
+    canary_outputs = filter_canary_outputs(parser_outputs, gold_labels)
 
     report = run_canary_evaluation(canary_outputs, gold_labels)
 
@@ -263,12 +342,12 @@ def review_queue(invariant_report, limit):
     from .human_loop.queue import ReviewQueue, ReviewItem
     from .models.enums import AlertLevel
     from .config import config
-    
+
     with open(invariant_report, encoding="utf-8") as f:
         report = json.load(f)
-    
+
     queue = ReviewQueue()
-    
+
     for v in report.get("violations", []):
         severity = AlertLevel.CRITICAL if v["severity"] == "critical" else AlertLevel.WARNING
         item = ReviewItem(
@@ -281,16 +360,16 @@ def review_queue(invariant_report, limit):
             confidence=0.5
         )
         queue.add(item)
-    
+
     # get priority batch
     batch = queue.get_daily_batch()
     critical = queue.get_critical_items()
-    
+
     click.echo(f"\n=== REVIEW QUEUE ===")
     click.echo(f"total items: {len(queue.items)}")
     click.echo(f"critical items: {len(critical)}")
     click.echo(f"daily batch: {len(batch)}")
-    
+
     click.echo(f"\n--- top {limit} items ---")
     for item in batch[:limit]:
         emoji = "🔴" if item.severity == AlertLevel.CRITICAL else "🟡"
@@ -323,87 +402,116 @@ def analyze(data, out, baseline, current):
         generate_confidence_report,
         generate_human_review_sheet
     )
+    from .io.loader import load_gold_labels, load_jsonl_many
+    from .models.inputs import JournalEntry, ParserOutput
+    from .invariants.runner import run_invariant_checks
+    from .metrics.comparator import run_drift_analysis
+    from .canary.runner import run_canary_evaluation, filter_canary_outputs
+    from concurrent.futures import ProcessPoolExecutor
     import json
-    
+    import os
+
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
     data_path = Path(data)
     out_path = Path(out)
     out_path.mkdir(parents=True, exist_ok=True)
-    
-    click.echo("=== ADVANCED ANALYSIS ===\n")
-    
-    # load data
-    journals = load_journals_as_dict(data_path / "journals.jsonl")
-    baseline_outputs, _ = load_parser_outputs(data_path / baseline)
-    current_outputs, _ = load_parser_outputs(data_path / current)
-    
-    # run checks
-    invariant_report = run_invariant_checks(current_outputs, journals)
-    drift_report = run_drift_analysis(baseline_outputs, current_outputs, baseline, current)
-    
-    # canary if exists
+    # derived paths built once, as in run()
+    journals_path = data_path / "journals.jsonl"
+    baseline_path = data_path / baseline
+    current_path = data_path / current
     canary_path = data_path / "canary" / "gold.jsonl"
-    canary_report = None
-    if canary_path.exists():
-        gold_labels, _ = load_gold_labels(canary_path)
-        canary_ids = {g.journal_id for g in gold_labels}
-        canary_outputs = [o for o in current_outputs if o.journal_id in canary_ids]
-        canary_report = run_canary_evaluation(canary_outputs, gold_labels)
-    
-    # 1. Diff Visualization
-    diff_viz = generate_diff_visualization(drift_report)
-    click.echo(diff_viz)
-    
-    # 2. Auto-Diagnosis
-    click.echo("=== AUTO-DIAGNOSIS ===")
-    diagnosis = generate_auto_diagnosis(invariant_report)
-    if diagnosis["patterns_detected"]:
-        click.echo(f"\n🔍 Patterns detected: {len(diagnosis['patterns_detected'])}")
-        for pattern in diagnosis["patterns_detected"]:
-            click.echo(f"  • {pattern['type']}: {pattern['description']}")
-        click.echo(f"\n💡 Likely causes:")
-        for cause in diagnosis["likely_causes"]:
-            click.echo(f"  → {cause}")
-        click.echo(f"\n🔧 Recommended actions:")
-        for action in diagnosis["recommended_actions"]:
-            click.echo(f"  ✓ {action}")
-    else:
-        click.echo("  No systematic patterns detected.")
-    
-    # 3. Confidence Intervals
-    click.echo("\n=== CONFIDENCE INTERVALS (95%) ===")
-    confidence = generate_confidence_report(invariant_report)
-    for metric_name, metric_data in confidence["metrics"].items():
-        click.echo(f"  {metric_name}: {metric_data['display']}")
-    click.echo(f"\n📊 Interpretation: {confidence['interpretation']}")
-    
-    # 4. Alert Timeline
-    click.echo("\n=== SIMULATED ALERT TIMELINE ===")
-    timeline = generate_alert_timeline(invariant_report, drift_report, canary_report)
-    for day in timeline:
-        click.echo(f"  Day {day['day']} ({day['date']}): {day['icon']} {day['status']}")
-        for event in day["events"][:2]:  # limit events shown
-            click.echo(f"       └─ {event}")
-    
-    # 5. Generate Human Review Sheet
-    review_sheet = generate_human_review_sheet(invariant_report, journals)
-    review_path = out_path / "human_review_sheet.md"
-    with open(review_path, "w", encoding="utf-8") as f:
-        f.write(review_sheet)
-    click.echo(f"\n✅ Human review sheet exported to: {review_path}")
-    
-    # Save analysis to JSON
-    analysis_output = {
-        "diff_visualization": diff_viz,
-        "diagnosis": diagnosis,
-        "confidence_intervals": confidence,
-        "timeline": timeline
-    }
-    analysis_path = out_path / "advanced_analysis.json"
-    with open(analysis_path, "w", encoding="utf-8") as f:
-        json.dump(analysis_output, f, indent=2, default=str)
-    click.echo(f"✅ Full analysis saved to: {analysis_path}")
+
+    with BufferedEcho() as echo:
+        echo("=== ADVANCED ANALYSIS ===\n")
+
+        # load data - same parallel decode as run()
+        (journal_entries, _), (baseline_outputs, _), (current_outputs, _) = load_jsonl_many([
+            (journals_path, JournalEntry),
+            (baseline_path, ParserOutput),
+            (current_path, ParserOutput),
+        ])
+        journals = {j.journal_id: j.text for j in journal_entries}
+
+        # run checks - same parallel stage layout as run()
+        with ProcessPoolExecutor(max_workers=3) as pool:
+            f_invariant = pool.submit(run_invariant_checks, current_outputs, journals)
+            f_drift = pool.submit(run_drift_analysis, baseline_outputs, current_outputs, baseline, current)
+            f_canary = None
+            if canary_path.exists():
+                gold_labels, _ = load_gold_labels(canary_path)
+                canary_outputs = filter_canary_outputs(current_outputs, gold_labels)
+                f_canary = pool.submit(run_canary_evaluation, canary_outputs, gold_labels)
+
+            invariant_report = f_invariant.result()
+            drift_report = f_drift.result()
+            canary_report = f_canary.result() if f_canary else None
+
+        # 1. Diff Visualization
+        diff_viz = generate_diff_visualization(drift_report)
+        echo(diff_viz)
+
+        # 2. Auto-Diagnosis
+        echo("=== AUTO-DIAGNOSIS ===")
+        diagnosis = generate_auto_diagnosis(invariant_report)
+        if diagnosis["patterns_detected"]:
+            echo(f"\n🔍 Patterns detected: {len(diagnosis['patterns_detected'])}")
+            for pattern in diagnosis["patterns_detected"]:
+                echo(f"  • {pattern['type']}: {pattern['description']}")
+            echo(f"\n💡 Likely causes:")
+            for cause in diagnosis["likely_causes"]:
+                echo(f"  → {cause}")
+            echo(f"\n🔧 Recommended actions:")
+            for action in diagnosis["recommended_actions"]:
+                echo(f"  ✓ {action}")
+        else:
+            echo("  No systematic patterns detected.")
+
+        # 3. Confidence Intervals
+        echo("\n=== CONFIDENCE INTERVALS (95%) ===")
+        confidence = generate_confidence_report(invariant_report)
+        for metric_name, metric_data in confidence["metrics"].items():
+            echo(f"  {metric_name}: {metric_data['display']}")
+        echo(f"\n📊 Interpretation: {confidence['interpretation']}")
+
+        # 4. Alert Timeline
+        echo("\n=== SIMULATED ALERT TIMELINE ===")
+        timeline = generate_alert_timeline(invariant_report, drift_report, canary_report)
+        for day in timeline:
+            echo(f"  Day {day['day']} ({day['date']}): {day['icon']} {day['status']}")
+            for event in day["events"][:2]:  # limit events shown
+                echo(f"       └─ {event}")
+
+        # 5. Generate Human Review Sheet - single buffered write via a
+        # tempfile so a crash never leaves a half-written sheet behind
+        review_sheet = generate_human_review_sheet(invariant_report, journals)
+        review_path = out_path / "human_review_sheet.md"
+        tmp = review_path.with_suffix(".md.tmp")
+        tmp.write_bytes(review_sheet.encode("utf-8"))
+        os.replace(tmp, review_path)
+        echo(f"\n✅ Human review sheet exported to: {review_path}")
+
+        # Save analysis to JSON - orjson fast path as in io.writer, with the
+        # same atomic tempfile + rename dance
+        analysis_output = {
+            "diff_visualization": diff_viz,
+            "diagnosis": diagnosis,
+            "confidence_intervals": confidence,
+            "timeline": timeline
+        }
+        analysis_path = out_path / "advanced_analysis.json"
+        if orjson is not None:
+            payload = orjson.dumps(analysis_output, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            payload = json.dumps(analysis_output, indent=2, default=str).encode("utf-8")
+        tmp = analysis_path.with_suffix(".json.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, analysis_path)
+        echo(f"✅ Full analysis saved to: {analysis_path}")
 
 
 if __name__ == "__main__":
     cli()
-
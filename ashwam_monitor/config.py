@@ -1,7 +1,8 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 
-@dataclass
+@dataclass(frozen=True)
 class InvariantThresholds:
     """thresholds for invariant checks - conservative for health apps"""
     min_schema_validity: float = 0.95
@@ -10,7 +11,7 @@ class InvariantThresholds:
     max_contradiction_rate: float = 0.01
 
 
-@dataclass
+@dataclass(frozen=True)
 class DriftThresholds:
     """when to flag drift vs breakage"""
     js_drift: float = 0.10  # jensen shannon above this is drift
@@ -21,7 +22,7 @@ class DriftThresholds:
     volume_change_pct: float = 25.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class CanaryThresholds:
     """f1 levels for different actions"""
     f1_pass: float = 0.70
@@ -40,8 +41,20 @@ class CanaryThresholds:
         "thresholds spaced 0.10 apart to allow graduated response."
     )
 
+    @cached_property
+    def thresholds_used(self) -> dict:
+        # built once per config instance for report embedding
+        # (pydantic re-validates it into a fresh dict, so no aliasing)
+        return {
+            "f1_pass": self.f1_pass,
+            "f1_alert": self.f1_alert,
+            "f1_human_review": self.f1_human_review,
+            "f1_rollback": self.f1_rollback,
+            "min_evidence_match": self.min_evidence_match
+        }
 
-@dataclass
+
+@dataclass(frozen=True)
 class HumanReviewConfig:
     max_daily_reviews: int = 30
     escalation_timeout_hours: int = 24
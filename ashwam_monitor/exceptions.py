@@ -10,6 +10,11 @@ class DataLoadError(AshwamMonitorError):
         self.reason = reason
         super().__init__(f"failed to load {path}: {reason}")
 
+    def __reduce__(self):
+        # default exception pickling replays __init__ with args, which for a
+        # custom signature breaks when raised inside a process pool worker
+        return (DataLoadError, (self.path, self.reason))
+
 
 class SchemaValidationError(AshwamMonitorError):
     """bad data in parser output"""
@@ -1,7 +1,24 @@
+from functools import lru_cache
+
 from ..models.inputs import ParserItem
 from .templates import CLINICIAN_TEMPLATE
 
 
+# fixed caveat text per domain, looked up instead of rebuilt per item
+_DOMAIN_LIMITS = {
+    "emotion": ("emotion detection may miss sarcasm or complex expressions",),
+    "symptom": ("negation detection accuracy ~90%",),
+    "mind": ("mind domain requires inference may be less reliable",),
+}
+
+
+@lru_cache(maxsize=256)
+def _lower(text: str) -> str:
+    # one review sheet renders a view per item of the same journal, so the
+    # lowered copy of the (potentially long) journal text is worth caching
+    return text.lower()
+
+
 def generate_clinician_view(
     item: ParserItem,
     journal_text: str,
@@ -11,12 +28,14 @@ def generate_clinician_view(
     generate clinician focused review
     shows evidence grounding and limitations
     """
-    # find context around evidence span
+    # find context around evidence span. try the exact-case match first -
+    # spans are verbatim quotes most of the time, so this usually skips
+    # touching the lowered copy entirely; the fallback reuses the cached
+    # lowered journal text
     evidence = item.evidence_span
-    lower_text = journal_text.lower()
-    lower_evidence = evidence.lower()
-
-    start = lower_text.find(lower_evidence)
+    start = journal_text.find(evidence)
+    if start < 0:
+        start = _lower(journal_text).find(evidence.lower())
     if start >= 0:
         # show some context before and after
         ctx_start = max(0, start - 20)
@@ -30,13 +49,7 @@ def generate_clinician_view(
         context = f"[span not found in source: '{evidence}']"
 
     # domain specific limitations
-    limitations = []
-    if item.domain.value == "emotion":
-        limitations.append("emotion detection may miss sarcasm or complex expressions")
-    if item.domain.value == "symptom":
-        limitations.append("negation detection accuracy ~90%")
-    if item.domain.value == "mind":
-        limitations.append("mind domain requires inference may be less reliable")
+    limitations = list(_DOMAIN_LIMITS.get(item.domain, ()))
     if item.confidence < 0.7:
         limitations.append(f"low confidence ({item.confidence:.0%}) - review carefully")
 
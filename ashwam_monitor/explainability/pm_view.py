@@ -1,16 +1,28 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from ..models.outputs import InvariantReport, DriftReport, CanaryReport
 from .templates import PM_TEMPLATE
 
+# status icons hoisted so the per-metric branches compare against constants
+_OK = "✓"
+_WARN = "⚠️"
+
+
+@lru_cache(maxsize=64)
+def _critical_count(alerts: tuple) -> int:
+    # keyed on the alerts tuple so regenerating views for the same report
+    # (run + analyze both render it) skips the rescan
+    return sum(1 for a in alerts if a.startswith("CRITICAL"))
+
 
 def get_status_emoji(report: InvariantReport, drift: DriftReport = None, canary: CanaryReport = None) -> str:
     # determine overall status
-    critical_count = sum(1 for a in report.alerts if "CRITICAL" in a)
+    critical_count = _critical_count(tuple(report.alerts))
     if critical_count > 0:
         return "🔴 CRITICAL"
-    if canary and canary.action.value == "ROLLBACK":
+    if canary and canary.action == "ROLLBACK":
         return "🔴 CRITICAL"
     elif report.hallucination_rate > 0.05:
         return "🟡 DEGRADED"
@@ -24,24 +36,39 @@ def format_metric(name: str, value: float, threshold: float = None, is_rate: boo
     else:
         val_str = f"{value:.2f}"
 
-    status = "✓"
+    status = _OK
     if threshold and is_rate:
         if name.startswith("hallucination") or name.startswith("contradiction"):
             if value > threshold:
-                status = "⚠️"
+                status = _WARN
         else:
             if value < threshold:
-                status = "⚠️"
+                status = _WARN
 
     return {"name": name, "value": val_str, "status": status}
 
 
+# rendered views keyed by the (invariant, drift, canary) run_id triple -
+# run_ids are unique per pipeline run, so a repeat render of the same report
+# combo (e.g. run then analyze in one process) returns the cached markdown
+_rendered: dict = {}
+
+
 def generate_pm_view(
-    invariant: InvariantReport, 
+    invariant: InvariantReport,
     drift: Optional[DriftReport] = None,
     canary: Optional[CanaryReport] = None
 ) -> str:
     # generate pm focused dashboard with system health and risk signals
+    key = (
+        invariant.run_id,
+        drift.run_id if drift else None,
+        canary.run_id if canary else None,
+    )
+    cached = _rendered.get(key)
+    if cached is not None:
+        return cached
+
     status = get_status_emoji(invariant, drift, canary)
 
     metrics = [
@@ -52,18 +79,20 @@ def generate_pm_view(
     ]
 
     if drift:
-        for m in drift.metrics:
-            metrics.append({
+        metrics.extend(
+            {
                 "name": m.name,
                 "value": f"{m.current_value:.2f}",
-                "status": "⚠️" if m.status.value != "STABLE" else "✓"
-            })
+                "status": _WARN if m.status != "STABLE" else _OK
+            }
+            for m in drift.metrics
+        )
 
     if canary:
         metrics.append({
             "name": "canary_f1",
             "value": f"{canary.f1:.1%}",
-            "status": "⚠️" if canary.f1 < 0.5 else "✓"
+            "status": _WARN if canary.f1 < 0.5 else _OK
         })
 
     # combine alerts
@@ -77,19 +106,23 @@ def generate_pm_view(
         actions.append("review prompt for hallucination patterns")
     if invariant.contradiction_rate > 0.01:
         actions.append("investigate contradiction source")
-    if drift and any(m.status.value == "BREAKAGE" for m in drift.metrics):
+    if drift and any(m.status == "BREAKAGE" for m in drift.metrics):
         actions.append("consider model rollback")
-    if canary and canary.action.value == "HUMAN_REVIEW":
+    if canary and canary.action == "HUMAN_REVIEW":
         actions.append("queue canary journals for clinical review")
-    if canary and canary.action.value == "ROLLBACK":
+    if canary and canary.action == "ROLLBACK":
         actions.append("immediate model rollback required")
     if not actions:
         actions.append("no immediate actions required")
 
-    return PM_TEMPLATE.render(
+    rendered = PM_TEMPLATE.render(
         timestamp=invariant.timestamp.strftime("%Y-%m-%d %H:%M"),
         status=status,
         metrics=metrics,
         alerts=alerts,
         actions=actions
     )
+    if len(_rendered) >= 32:
+        _rendered.clear()
+    _rendered[key] = rendered
+    return rendered
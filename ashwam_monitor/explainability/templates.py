@@ -1,7 +1,12 @@
-from jinja2 import Template
+from jinja2 import Environment
 
+# single shared environment: templates are string constants compiled once at
+# import, auto_reload off and an unbounded cache keep renders free of any
+# recompile checks
+_env = Environment(auto_reload=False, cache_size=-1)
 
-PM_TEMPLATE = Template("""## System Health - {{ timestamp }}
+
+PM_TEMPLATE = _env.from_string("""## System Health - {{ timestamp }}
 
 **Status**: {{ status }}
 
@@ -23,7 +28,7 @@ PM_TEMPLATE = Template("""## System Health - {{ timestamp }}
 """)
 
 
-CLINICIAN_TEMPLATE = Template("""## Extraction Review - {{ journal_id }}
+CLINICIAN_TEMPLATE = _env.from_string("""## Extraction Review - {{ journal_id }}
 
 ### Decision
 - **Extracted**: "{{ evidence_span }}"
@@ -46,7 +51,7 @@ CLINICIAN_TEMPLATE = Template("""## Extraction Review - {{ journal_id }}
 """)
 
 
-USER_TEMPLATE = Template("""### What We Noticed
+USER_TEMPLATE = _env.from_string("""### What We Noticed
 
 {{ summary }}
 
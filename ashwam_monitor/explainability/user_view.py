@@ -15,17 +15,17 @@ def generate_user_view(items: List[ParserItem], needs_confirmation: bool = False
             needs_confirmation=False
         )
 
-    # group by domain for friendly summary
-    symptoms = [i for i in items if i.domain.value == "symptom"]
-    emotions = [i for i in items if i.domain.value == "emotion"]
-    foods = [i for i in items if i.domain.value == "food"]
+    # one pass over items instead of three domain-filtered scans - only
+    # presence per domain matters for the summary (Domain is a str enum, so
+    # membership checks compare against the plain string)
+    domains_seen = {i.domain for i in items}
 
     summary_parts = []
-    if symptoms:
+    if "symptom" in domains_seen:
         summary_parts.append("some health notes")
-    if emotions:
+    if "emotion" in domains_seen:
         summary_parts.append("how you were feeling")
-    if foods:
+    if "food" in domains_seen:
         summary_parts.append("what you ate")
 
     if summary_parts:
@@ -36,10 +36,10 @@ def generate_user_view(items: List[ParserItem], needs_confirmation: bool = False
     # friendly item descriptions based on domain
     item_texts = []
     for item in items[:5]:  # limit to 5
-        domain = item.domain.value
+        domain = item.domain
         span = item.evidence_span
 
-        if item.polarity.value == "absent":
+        if item.polarity == "absent":
             item_texts.append(f"No {span.lower()} mentioned ✓")
         elif domain == "symptom":
             item_texts.append(f"You mentioned: {span}")
@@ -1,6 +1,8 @@
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from itertools import count
+from typing import Dict, List, Optional
 from enum import Enum
 
 from ..models.enums import AlertLevel
@@ -34,29 +36,63 @@ class ReviewItem:
 class ReviewQueue:
     # priority queue for human review
     # handles limited clinician time by prioritizing critical items
-
+    #
+    # items sit in two max-heaps split at the severity boundary - criticals
+    # in one tier, warning/info in the other - keyed by the arrival-time
+    # priority component (severity weight x inverse confidence), which never
+    # changes and so is computed once at insert. only the age factor moves
+    # with wall time, and it is applied to the small candidate slice popped
+    # for a batch instead of re-scoring the whole backlog. the tier split
+    # guarantees a flood of aged warnings can never starve fresh criticals
+    # out of the daily batch
 
     def __init__(self):
         self.items: List[ReviewItem] = []
         self.cfg = config.human_review
+        self._q1: list = []  # criticals: (-base_priority, seq, item_id)
+        self._q2: list = []  # warning/info, same entry layout
+        self._by_id: Dict[str, ReviewItem] = {}
+        self._critical_ids: Dict[str, None] = {}  # ordered set of critical ids
+        self._seq = count()
+        # running totals, updated on every state transition so reporting
+        # never has to walk the backlog
+        self._pending_count = 0
+        self._critical_pending_count = 0
+        self._weights = {
+            AlertLevel.CRITICAL: self.cfg.critical_weight,
+            AlertLevel.WARNING: self.cfg.warning_weight,
+            AlertLevel.INFO: self.cfg.info_weight
+        }
 
     def add(self, item: ReviewItem) -> None:
         self.items.append(item)
-
-    def get_priority_score(self, item: ReviewItem) -> float:
+        self._by_id[item.id] = item
+        base = self._weights.get(item.severity, 10) * (1.0 - item.confidence)
+        entry = (-base, next(self._seq), item.id)
+        if item.severity == AlertLevel.CRITICAL:
+            heapq.heappush(self._q1, entry)
+            self._critical_ids[item.id] = None
+        else:
+            heapq.heappush(self._q2, entry)
+        if item.state == ReviewState.PENDING:
+            self._pending_count += 1
+            if item.severity == AlertLevel.CRITICAL:
+                self._critical_pending_count += 1
+
+    def get_priority_score(self, item: ReviewItem, now: Optional[datetime] = None) -> float:
 
         # higher score = higher priority
         # based on severity weight x age factor x inverse confidence
+        # batch operations pass a shared now snapshot so every item in one
+        # ranking is aged against the same clock (and the per-item
+        # datetime.now() call disappears from the sort)
 
-        weights = {
-            AlertLevel.CRITICAL: self.cfg.critical_weight,
-            AlertLevel.WARNING: self.cfg.warning_weight,
-            AlertLevel.INFO: self.cfg.info_weight
-        }
-        severity_weight = weights.get(item.severity, 10)
+        severity_weight = self._weights.get(item.severity, 10)
 
         # older items get higher priority
-        age_hours = (datetime.now() - item.created_at).total_seconds() / 3600
+        if now is None:
+            now = datetime.now()
+        age_hours = (now - item.created_at).total_seconds() / 3600
         age_factor = min(2.0, 1.0 + age_hours / 24)
 
         # lower confidence = higher priority
@@ -67,35 +103,94 @@ class ReviewQueue:
     def get_pending(self) -> List[ReviewItem]:
         return [i for i in self.items if i.state == ReviewState.PENDING]
 
+    def _pop_pending(self, heap: list, limit: int) -> List[ReviewItem]:
+        # pop up to limit still-pending items off a tier heap, rank that
+        # slice with the full age-aware score, and push the entries back
+        # since a batch read does not consume items. resolved items fall out
+        # of the heap lazily
+        candidates = []
+        while heap and len(candidates) < limit:
+            entry = heapq.heappop(heap)
+            item = self._by_id[entry[2]]
+            if item.state != ReviewState.PENDING:
+                continue
+            candidates.append((entry, item))
+
+        now = datetime.now()
+        ranked = sorted(
+            (item for _, item in candidates),
+            key=lambda item: self.get_priority_score(item, now),
+            reverse=True
+        )
+        for entry, _ in candidates:
+            heapq.heappush(heap, entry)
+        return ranked
+
     def get_daily_batch(self) -> List[ReviewItem]:
         # get prioritized batch for daily review
         # respects max_daily_reviews limit
-        pending = self.get_pending()
-        sorted_items = sorted(pending, key=self.get_priority_score, reverse=True)
-        return sorted_items[:self.cfg.max_daily_reviews]
+        #
+        # criticals drain first - every pending critical makes the batch,
+        # honoring the get_critical_items contract that criticals ignore the
+        # daily cap - then warning/info fill the remaining capacity from
+        # their own tier (a 2x candidate window; the age multiplier tops out
+        # at 2.0, so deeper entries rarely age past the window)
+        cap = self.cfg.max_daily_reviews
+        batch = self._pop_pending(self._q1, len(self._q1))[:cap]
+        room = cap - len(batch)
+        if room > 0:
+            batch.extend(self._pop_pending(self._q2, 2 * room)[:room])
+        return batch
+
+    def counts(self) -> tuple:
+        # (pending, critical_pending) from the running totals - O(1), for
+        # reporting that only needs the numbers, not the items
+        return self._pending_count, self._critical_pending_count
+
+    def _note_resolved(self, item: ReviewItem) -> None:
+        self._pending_count -= 1
+        if item.severity == AlertLevel.CRITICAL:
+            self._critical_pending_count -= 1
+
+    def snapshot(self) -> tuple:
+        # one walk classifying items for reporting - returns
+        # (pending, critical_pending) without the separate get_pending and
+        # get_critical_items scans
+        pending = []
+        critical_pending = []
+        for item in self.items:
+            if item.state != ReviewState.PENDING:
+                continue
+            pending.append(item)
+            if item.severity == AlertLevel.CRITICAL:
+                critical_pending.append(item)
+        return pending, critical_pending
 
     def get_critical_items(self) -> List[ReviewItem]:
         # critical items always need review regardless of daily limit
-        return [i for i in self.items 
-                if i.severity == AlertLevel.CRITICAL 
-                and i.state == ReviewState.PENDING]
+        return [self._by_id[i] for i in self._critical_ids
+                if self._by_id[i].state == ReviewState.PENDING]
 
     def escalate_aged_items(self) -> List[ReviewItem]:
         # items pending too long get escalated
         escalated = []
+        now = datetime.now()
         for item in self.items:
             if item.state != ReviewState.PENDING:
                 continue
-            age_hours = (datetime.now() - item.created_at).total_seconds() / 3600
+            age_hours = (now - item.created_at).total_seconds() / 3600
             if age_hours > self.cfg.escalation_timeout_hours:
                 item.state = ReviewState.ESCALATED
+                self._note_resolved(item)
                 escalated.append(item)
         return escalated
 
     def mark_reviewed(self, item_id: str, approved: bool, notes: str = "") -> bool:
-        for item in self.items:
-            if item.id == item_id:
-                item.state = ReviewState.APPROVED if approved else ReviewState.REJECTED
-                item.notes = notes
-                return True
-        return False
+        item = self._by_id.get(item_id)
+        if item is None:
+            return False
+        if item.state == ReviewState.PENDING:
+            self._note_resolved(item)
+        item.state = ReviewState.APPROVED if approved else ReviewState.REJECTED
+        item.notes = notes
+        return True
@@ -59,6 +59,12 @@ SENSITIVE DATA HANDLING:
 - minimum necessary context principle
 """
 
+# stripped once at import - every summary re-stripped all four blocks
+_TRIGGERS = REVIEW_TRIGGERS.strip()
+_CADENCE = REVIEW_CADENCE.strip()
+_SCALING = SCALING_STRATEGY.strip()
+_PRIVACY = PRIVACY_CONSIDERATIONS.strip()
+
 
 def build_review_queue_from_invariants(report: InvariantReport) -> ReviewQueue:
     """
@@ -72,7 +78,7 @@ def build_review_queue_from_invariants(report: InvariantReport) -> ReviewQueue:
             journal_id=violation.journal_id,
             violation_type=violation.violation_type,
             severity=violation.severity,
-            evidence_span=violation.details.split("'")[1] if "'" in violation.details else "",
+            evidence_span=violation.evidence_span or "",
             details=violation.details,
             confidence=0.5,  # default since we dont have it in violation
             created_at=datetime.now()
@@ -86,16 +92,17 @@ def get_review_summary(queue: ReviewQueue) -> dict:
     """
     summary of review queue state for reporting
     """
-    pending = queue.get_pending()
-    critical = queue.get_critical_items()
+    # counts come from the queue's running totals and the daily batch is
+    # cap-bounded, so this is O(1) in backlog size
+    pending, critical = queue.counts()
     daily = queue.get_daily_batch()
 
     return {
-        "total_pending": len(pending),
-        "critical_pending": len(critical),
+        "total_pending": pending,
+        "critical_pending": critical,
         "daily_batch_size": len(daily),
-        "review_triggers": REVIEW_TRIGGERS.strip(),
-        "cadence": REVIEW_CADENCE.strip(),
-        "scaling_strategy": SCALING_STRATEGY.strip(),
-        "privacy": PRIVACY_CONSIDERATIONS.strip()
+        "review_triggers": _TRIGGERS,
+        "cadence": _CADENCE,
+        "scaling_strategy": _SCALING,
+        "privacy": _PRIVACY
     }
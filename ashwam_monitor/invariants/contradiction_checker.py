@@ -2,6 +2,12 @@ from typing import List
 from collections import defaultdict
 
 from ..models.inputs import ParserOutput
+from ..models.enums import Polarity
+
+# one bit per polarity value - a span's fold has >1 bit set exactly when its
+# items disagree, so the cardinality test is mask & (mask - 1) on an int
+# instead of building a set per span
+_POLARITY_BIT = {Polarity.PRESENT: 1, Polarity.ABSENT: 2}
 
 
 def find_contradictions(outputs: List[ParserOutput]) -> tuple:
@@ -10,33 +16,57 @@ def find_contradictions(outputs: List[ParserOutput]) -> tuple:
     contradictions = []
 
     for output in outputs:
-        span_map = defaultdict(list)
+        total_items += len(output.items)
+
+        if len(output.items) < 2:
+            continue
+
+        # pull polarities into a plain list once - the pydantic attribute
+        # descriptor is the costly part of these loops, and the list serves
+        # both the homogeneity check and the grouping pass below
+        polarities = [item.polarity for item in output.items]
+
+        # a journal whose items all share one polarity cannot contradict
+        # itself - skip the span grouping entirely (most journals on a
+        # healthy day are homogeneous)
+        first_polarity = polarities[0]
+        if all(p is first_polarity for p in polarities):
+            continue
+
+        # one pass: most spans occur once, so the first sighting lands in a
+        # plain dict with no list; only a repeated span spills into the
+        # duplicates dict that conflict emission then inspects. polarity
+        # bits fold alongside
+        first = {}
+        duplicated = {}
+        span_mask = defaultdict(int)
 
         for idx, item in enumerate(output.items):
-            total_items += 1
-            span_key = item.evidence_span.lower().strip()
-            span_map[span_key].append({
-                "index": idx,
-                "item": item
-            })
-
-        for span, items in span_map.items():
-            if len(items) < 2:
-                continue
-
-            polarities = set(i["item"].polarity for i in items)
-            if len(polarities) > 1:
+            span_key = item.span_key
+            span_mask[span_key] |= _POLARITY_BIT[polarities[idx]]
+            prev = first.get(span_key)
+            if prev is None:
+                first[span_key] = (idx, item)
+            elif span_key not in duplicated:
+                duplicated[span_key] = [prev, (idx, item)]
+            else:
+                duplicated[span_key].append((idx, item))
+
+        for span, grouped in duplicated.items():
+            mask = span_mask[span]
+            if mask & (mask - 1):
+                # dicts are built only for the (rare) conflicting spans
                 contradictions.append({
                     "journal_id": output.journal_id,
                     "evidence_span": span,
                     "conflicting_items": [
                         {
-                            "index": i["index"],
-                            "polarity": i["item"].polarity.value,
-                            "confidence": i["item"].confidence,
-                            "domain": i["item"].domain.value
+                            "index": idx,
+                            "polarity": item.polarity.value,
+                            "confidence": item.confidence,
+                            "domain": item.domain.value
                         }
-                        for i in items
+                        for idx, item in grouped
                     ]
                 })
 
@@ -1,54 +1,144 @@
 from typing import List, Dict
 from collections import Counter
 
+try:
+    # pyahocorasick finds all spans in one linear scan of the journal
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from ..models.inputs import ParserOutput
 
 
 def check_evidence_exists(evidence_span: str, journal_text: str) -> bool:
     # check if evidence span appears in journal text, handles partial matches
-    evidence = evidence_span.lower().strip()
-    text = journal_text.lower()
+    return _evidence_in_text(evidence_span.lower().strip(), journal_text.lower())
+
 
+def _evidence_in_text(evidence: str, text: str) -> bool:
+    # same check with both sides pre-lowercased, so callers looping over a
+    # journal's items only pay for the lowercase once
     if evidence in text:
         return True
 
-    # check if source contains a shorter version of evidence
-    words = evidence.split()
-    for i in range(len(words), 1, -1):
-        partial = " ".join(words[:i])
-        if partial in text and len(partial) > 5:
+    # check if source contains a shorter version of evidence. trim one word
+    # off the end of the previous prefix instead of re-joining from scratch,
+    # so a k-word span slices k strings rather than building k joins.
+    # prefixes only shrink, so the first one under the length gate ends the
+    # loop; it also stops before a lone first word, which the old two-word
+    # minimum never searched
+    partial = evidence
+    sp = partial.rfind(" ")
+    while sp > 0:
+        partial = partial[:sp]
+        sp = partial.rfind(" ")
+        if sp <= 0 or len(partial) <= 5:
+            break
+        if partial in text:
             return True
 
     return False
 
 
+def _candidate_patterns(evidence: str) -> List[str]:
+    # the span itself plus the shortened word-prefixes check_evidence_exists
+    # accepts - same incremental trim as _evidence_in_text so the automaton
+    # and scan paths stay in lockstep
+    patterns = [evidence] if evidence else []
+    partial = evidence
+    sp = partial.rfind(" ")
+    while sp > 0:
+        partial = partial[:sp]
+        sp = partial.rfind(" ")
+        if sp <= 0 or len(partial) <= 5:
+            break
+        patterns.append(partial)
+    return patterns
+
+
+def _unmatched_item_indexes(spans: List[str], journal_text_lower: str) -> List[int]:
+    # one aho-corasick scan of the journal instead of a substring search per
+    # item. takes the pre-normalized span per item so a fused caller that
+    # already extracted them doesn't walk the items again; duplicate spans
+    # within a journal are compiled and resolved once
+    automaton = ahocorasick.Automaton()
+    patterns_by_span = {}
+    for span in spans:
+        if span not in patterns_by_span:
+            patterns = _candidate_patterns(span)
+            patterns_by_span[span] = patterns
+            for p in patterns:
+                automaton.add_word(p, p)
+
+    if len(automaton) == 0:
+        # only empty spans - those always count as matched
+        return []
+
+    automaton.make_automaton()
+    found = {p for _, p in automaton.iter(journal_text_lower)}
+    missing_spans = {
+        span for span, patterns in patterns_by_span.items()
+        if patterns and not any(p in found for p in patterns)
+    }
+    return [idx for idx, span in enumerate(spans) if span in missing_spans]
+
+
+def _unmatched_indexes_scan(spans: List[str], journal_text_lower: str) -> List[int]:
+    # direct substring fallback, memoized per distinct span so duplicates
+    # within a journal are only searched once
+    span_found = {}
+    missing = []
+    for idx, span in enumerate(spans):
+        ok = span_found.get(span)
+        if ok is None:
+            ok = span_found[span] = _evidence_in_text(span, journal_text_lower)
+        if not ok:
+            missing.append(idx)
+    return missing
+
+
 def find_hallucinations(outputs: List[ParserOutput], journals: Dict[str, str]) -> tuple:
     # find items where evidence span doesnt exist in source, returns (rate, list, clustered)
     total_items = 0
     hallucinations = []
 
     for output in outputs:
-        journal_text = journals.get(output.journal_id, "")
+        if not output.items:
+            # nothing to ground - skip the lowercase and automaton setup
+            continue
+
+        # lowercase once per journal, not once per item
+        journal_lower = journals.get(output.journal_id, "").lower()
+        total_items += len(output.items)
 
-        for idx, item in enumerate(output.items):
-            total_items += 1
+        spans = [item.span_key for item in output.items]
+        # the automaton amortizes over many spans; for one or two items the
+        # build cost exceeds a couple of direct substring searches
+        if ahocorasick is not None and len(spans) >= 3:
+            missing = _unmatched_item_indexes(spans, journal_lower)
+        else:
+            missing = _unmatched_indexes_scan(spans, journal_lower)
 
-            if not check_evidence_exists(item.evidence_span, journal_text):
-                hallucinations.append({
-                    "journal_id": output.journal_id,
-                    "item_index": idx,
-                    "evidence_span": item.evidence_span,
-                    "domain": item.domain.value
-                })
+        for idx in missing:
+            item = output.items[idx]
+            hallucinations.append({
+                "journal_id": output.journal_id,
+                "item_index": idx,
+                "evidence_span": item.evidence_span,
+                "domain": item.domain.value
+            })
 
     rate = len(hallucinations) / total_items if total_items > 0 else 0.0
-    clustered = Counter(h["evidence_span"] for h in hallucinations)
+    clustered = Counter([h["evidence_span"] for h in hallucinations])
 
     return rate, hallucinations, dict(clustered)
 
 
 def compute_evidence_validity(outputs: List[ParserOutput], journals: Dict[str, str]) -> tuple:
     # returns (validity_rate, list of invalid items), validity is inverse of hallucination
+    # standalone convenience only: run_invariant_checks calls
+    # find_hallucinations once and derives the rate as 1.0 - hall_rate, so
+    # calling both from a pipeline would scan every journal twice
     hall_rate, hallucinations, _ = find_hallucinations(outputs, journals)
     validity_rate = 1.0 - hall_rate
     return validity_rate, hallucinations
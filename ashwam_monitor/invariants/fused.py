@@ -0,0 +1,192 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+from collections import Counter, defaultdict
+
+from ..models.inputs import ParserOutput
+
+from .contradiction_checker import _POLARITY_BIT
+from .schema_checker import check_item_schema, item_schema_ok
+from .evidence_checker import (
+    ahocorasick,
+    _unmatched_item_indexes,
+    _unmatched_indexes_scan,
+)
+
+# below this many journals the process pool costs more than it saves
+_PARALLEL_MIN_JOURNALS = 512
+
+
+class _SlimItem:
+    # plain slotted shadow of ParserItem for the fused pass. attribute reads
+    # on pydantic models go through descriptor dispatch, and the checks read
+    # each item's fields several times per batch; slots make those C-level
+    # struct reads. built once per journal, never leaves this module
+    __slots__ = ("span_key", "evidence_span", "polarity", "domain",
+                 "confidence", "arousal_bucket", "intensity_bucket")
+
+    def __init__(self, item):
+        self.span_key = item.span_key
+        self.evidence_span = item.evidence_span
+        self.polarity = item.polarity
+        self.domain = item.domain
+        self.confidence = item.confidence
+        self.arousal_bucket = item.arousal_bucket
+        self.intensity_bucket = item.intensity_bucket
+
+
+def _check_outputs(outputs: List[ParserOutput], journals: Dict[str, str]) -> Tuple:
+    # the fused per-journal walk; returns raw aggregates so chunked results
+    # reduce by concatenation, with rates computed once at the end
+    total_items = 0
+    valid_items = 0
+    schema_violations = []
+    hallucinations = []
+    contradictions = []
+
+    for output in outputs:
+        # each field is read 2-3 times below; pull them off the pydantic
+        # descriptors once. the schema helpers duck-type over the shadow
+        items = [_SlimItem(item) for item in output.items]
+        n = len(items)
+        total_items += n
+        if n == 0:
+            continue
+
+        journal_id = output.journal_id
+        journal_lower = journals.get(journal_id, "").lower()
+        # normalized spans and polarities pulled once - these feed both the
+        # evidence lookup and the contradiction grouping. span_key is the
+        # interned normalized span cached on the item itself
+        spans = [item.span_key for item in items]
+        polarities = [item.polarity for item in items]
+
+        # schema check per item - allocation-free predicate on the happy
+        # path, error messages built only for the violating few
+        for idx, item in enumerate(items):
+            if item_schema_ok(item):
+                valid_items += 1
+            else:
+                schema_violations.append({
+                    "journal_id": journal_id,
+                    "item_index": idx,
+                    "errors": check_item_schema(item)
+                })
+
+        # evidence grounding - same path split as find_hallucinations
+        if ahocorasick is not None and n >= 3:
+            missing = _unmatched_item_indexes(spans, journal_lower)
+        else:
+            missing = _unmatched_indexes_scan(spans, journal_lower)
+        for idx in missing:
+            item = items[idx]
+            hallucinations.append({
+                "journal_id": journal_id,
+                "item_index": idx,
+                "evidence_span": item.evidence_span,
+                "domain": item.domain.value
+            })
+
+        # contradictions - skip single-item and homogeneous journals
+        if n < 2:
+            continue
+        first_polarity = polarities[0]
+        if all(p is first_polarity for p in polarities):
+            continue
+
+        # same spill-on-duplicate grouping as find_contradictions: unique
+        # spans never allocate a list
+        first = {}
+        duplicated = {}
+        span_mask = defaultdict(int)
+        for idx, span in enumerate(spans):
+            span_mask[span] |= _POLARITY_BIT[polarities[idx]]
+            prev = first.get(span)
+            if prev is None:
+                first[span] = idx
+            elif span not in duplicated:
+                duplicated[span] = [prev, idx]
+            else:
+                duplicated[span].append(idx)
+
+        for span, grouped in duplicated.items():
+            mask = span_mask[span]
+            if mask & (mask - 1):
+                contradictions.append({
+                    "journal_id": journal_id,
+                    "evidence_span": span,
+                    "conflicting_items": [
+                        {
+                            "index": idx,
+                            "polarity": items[idx].polarity.value,
+                            "confidence": items[idx].confidence,
+                            "domain": items[idx].domain.value
+                        }
+                        for idx in grouped
+                    ]
+                })
+
+    return total_items, valid_items, schema_violations, hallucinations, contradictions
+
+
+def _check_chunk(job) -> Tuple:
+    # module-level so it pickles for the process pool
+    outputs, journals = job
+    return _check_outputs(outputs, journals)
+
+
+def run_all_checks(outputs: List[ParserOutput], journals: Dict[str, str]) -> dict:
+    """
+    single fused pass over all outputs covering schema, evidence and
+    contradiction checks
+
+    the standalone checkers each walk every item of every journal; calling
+    all three touches items three times and lowercases/normalizes the same
+    strings repeatedly. this walks each journal once, extracts the item
+    attributes a single time, and shares the normalized spans between the
+    evidence lookup and the contradiction grouping. journals are independent,
+    so large batches are split across worker processes and the chunk results
+    concatenated back in order. results are identical to running the three
+    checkers separately
+    """
+    if len(outputs) < _PARALLEL_MIN_JOURNALS:
+        totals = [_check_outputs(outputs, journals)]
+    else:
+        workers = os.cpu_count() or 1
+        chunk_size = -(-len(outputs) // workers)  # ceil division
+        jobs = []
+        for i in range(0, len(outputs), chunk_size):
+            part = outputs[i:i + chunk_size]
+            # ship only the journal texts this chunk needs
+            part_journals = {o.journal_id: journals[o.journal_id]
+                             for o in part if o.journal_id in journals}
+            jobs.append((part, part_journals))
+        with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+            totals = list(executor.map(_check_chunk, jobs))
+
+    total_items = 0
+    valid_items = 0
+    schema_violations = []
+    hallucinations = []
+    contradictions = []
+    for items_n, valid_n, schema_part, hall_part, contra_part in totals:
+        total_items += items_n
+        valid_items += valid_n
+        schema_violations.extend(schema_part)
+        hallucinations.extend(hall_part)
+        contradictions.extend(contra_part)
+
+    schema_rate = valid_items / total_items if total_items > 0 else 1.0
+    hall_rate = len(hallucinations) / total_items if total_items > 0 else 0.0
+    contra_rate = len(contradictions) / total_items if total_items > 0 else 0.0
+
+    return {
+        "total_items": total_items,
+        "schema_rate": schema_rate,
+        "schema_violations": schema_violations,
+        "hall_rate": hall_rate,
+        "hallucinations": hallucinations,
+        "hall_clusters": dict(Counter([h["evidence_span"] for h in hallucinations])),
+        "contra_rate": contra_rate,
+        "contradictions": contradictions,
+    }
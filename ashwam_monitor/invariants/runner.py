@@ -7,9 +7,7 @@ from ..models.outputs import InvariantReport, InvariantViolation, InvariantDefin
 from ..models.enums import AlertLevel
 from ..config import config
 
-from .schema_checker import compute_schema_validity
-from .evidence_checker import find_hallucinations, compute_evidence_validity
-from .contradiction_checker import find_contradictions
+from .fused import run_all_checks
 from .definitions import ALL_INVARIANTS
 
 
@@ -20,18 +18,35 @@ def run_invariant_checks(
     # run all invariant checks and build a report
     run_id = f"inv-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
 
-    total_items = sum(len(o.items) for o in outputs)
     total_journals = len(outputs)
 
-    schema_rate, schema_violations = compute_schema_validity(outputs)
-    evidence_rate, evidence_violations = compute_evidence_validity(outputs, journals)
-    hall_rate, hallucinations, hall_clusters = find_hallucinations(outputs, journals)
-    contra_rate, contradictions = find_contradictions(outputs)
+    # one fused pass covers schema, evidence and contradiction checks;
+    # evidence validity is 1 - hallucination rate, so no extra scan
+    results = run_all_checks(outputs, journals)
+    total_items = results["total_items"]
+    schema_rate = results["schema_rate"]
+    schema_violations = results["schema_violations"]
+    hall_rate = results["hall_rate"]
+    hallucinations = results["hallucinations"]
+    hall_clusters = results["hall_clusters"]
+    evidence_rate = 1.0 - hall_rate
+    contra_rate = results["contra_rate"]
+    contradictions = results["contradictions"]
 
     violations = []
+    # gate on (journal, item, invariant) so a later merge of violation
+    # sources can never emit the same record twice and downstream consumers
+    # don't need their own in-list dedup scans
+    seen = set()
+
+    def _emit(violation):
+        key = (violation.journal_id, violation.item_index, violation.invariant_name)
+        if key not in seen:
+            seen.add(key)
+            violations.append(violation)
 
     for v in schema_violations:
-        violations.append(InvariantViolation(
+        _emit(InvariantViolation(
             journal_id=v["journal_id"],
             item_index=v["item_index"],
             invariant_name="schema_validity",
@@ -41,24 +56,26 @@ def run_invariant_checks(
         ))
 
     for h in hallucinations:
-        violations.append(InvariantViolation(
+        _emit(InvariantViolation(
             journal_id=h["journal_id"],
             item_index=h["item_index"],
             invariant_name="hallucination",
             violation_type="evidence_not_found",
             details=f"span '{h['evidence_span']}' not in source",
-            severity=AlertLevel.CRITICAL
+            severity=AlertLevel.CRITICAL,
+            evidence_span=h["evidence_span"]
         ))
 
     for c in contradictions:
         for item in c["conflicting_items"]:
-            violations.append(InvariantViolation(
+            _emit(InvariantViolation(
                 journal_id=c["journal_id"],
                 item_index=item["index"],
                 invariant_name="contradiction",
                 violation_type="polarity_conflict",
                 details=f"span '{c['evidence_span']}' has conflicting polarity",
-                severity=AlertLevel.CRITICAL
+                severity=AlertLevel.CRITICAL,
+                evidence_span=c["evidence_span"]
             ))
 
     alerts = []
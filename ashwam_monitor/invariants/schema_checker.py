@@ -23,6 +23,22 @@ def check_item_schema(item: ParserItem) -> List[str]:
     return errors
 
 
+def item_schema_ok(item: ParserItem) -> bool:
+    # branch-only version of check_item_schema for the hot path: most items
+    # are valid, and this answers without allocating the error list. callers
+    # fall back to check_item_schema for the messages only when this is False
+    # (identity compare - enum fields are the member singletons)
+    if item.domain is Domain.EMOTION:
+        if item.arousal_bucket is None:
+            return False
+    elif item.intensity_bucket is None:
+        return False
+    if item.confidence < 0 or item.confidence > 1:
+        return False
+    span = item.evidence_span
+    return bool(span and span.strip())
+
+
 def compute_schema_validity(outputs: List[ParserOutput]) -> tuple:
     # returns (validity_rate, list of violations)
     total_items = 0
@@ -32,15 +48,14 @@ def compute_schema_validity(outputs: List[ParserOutput]) -> tuple:
     for output in outputs:
         for idx, item in enumerate(output.items):
             total_items += 1
-            errors = check_item_schema(item)
-            if errors:
+            if item_schema_ok(item):
+                valid_items += 1
+            else:
                 violations.append({
                     "journal_id": output.journal_id,
                     "item_index": idx,
-                    "errors": errors
+                    "errors": check_item_schema(item)
                 })
-            else:
-                valid_items += 1
 
     rate = valid_items / total_items if total_items > 0 else 1.0
     return rate, violations
@@ -1,6 +1,9 @@
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Tuple
+
+from pydantic import ValidationError
 
 from ..models.inputs import ParserOutput, JournalEntry, GoldLabel
 from ..exceptions import DataLoadError
@@ -14,36 +17,97 @@ def load_jsonl(path: Path, model_class) -> Tuple[List, List[dict]]:
     valid = []
     errors = []
 
-    with open(path, encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
+    # read the whole file once and scan for newlines directly - cheaper than
+    # the file object's per-line iteration since we materialize everything anyway
+    buf = path.read_bytes()
+    size = len(buf)
+    start = 0
+    line_num = 0
+    while start < size:
+        end = buf.find(b"\n", start)
+        if end < 0:
+            end = size
+        line = buf[start:end].strip()
+        start = end + 1
+        line_num += 1
+        if not line:
+            continue
+
+        try:
+            # pydantic-core parses and validates the raw bytes in one
+            # rust-level pass - no intermediate python dict to build and
+            # tear down per line
+            valid.append(model_class.model_validate_json(line))
+        except ValidationError as e:
+            bad_json = any(err["type"] == "json_invalid" for err in e.errors())
+            errors.append({
+                "line": line_num,
+                "error": "bad json" if bad_json else "validation failed",
+                "details": str(e)
+            })
+        except Exception as e:
+            errors.append({
+                "line": line_num,
+                "error": "validation failed",
+                "details": str(e)
+            })
+
+    return valid, errors
+
+
+def iter_jsonl(path: Path, model_class) -> Iterator:
+    # stream validated records one at a time instead of materializing the file
+    # invalid lines are silently skipped - use load_jsonl when the error list matters
+    if not path.exists():
+        raise DataLoadError(str(path), "file not found")
+
+    with open(path, "rb", buffering=1 << 20) as f:
+        for line in f:
             line = line.strip()
             if not line:
                 continue
-
             try:
-                data = json.loads(line)
-                record = model_class.model_validate(data)
-                valid.append(record)
-            except json.JSONDecodeError as e:
-                errors.append({
-                    "line": line_num,
-                    "error": "bad json",
-                    "details": str(e)
-                })
-            except Exception as e:
-                errors.append({
-                    "line": line_num,
-                    "error": "validation failed",
-                    "details": str(e)
-                })
+                yield model_class.model_validate_json(line)
+            except Exception:
+                continue
+
+
+def _load_jsonl_job(job) -> Tuple[List, List[dict]]:
+    # module-level so it pickles for the process pool
+    path, model_class = job
+    return load_jsonl(path, model_class)
 
-    return valid, errors
+
+def load_jsonl_many(jobs: List[tuple]) -> List[Tuple[List, List[dict]]]:
+    # load several jsonl files at once, one worker per file
+    # decode+validate is cpu-bound so processes sidestep the GIL; results come
+    # back in job order. falls back to serial for a single file
+    jobs = list(jobs)
+    if len(jobs) < 2:
+        return [load_jsonl(path, model_class) for path, model_class in jobs]
+
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_load_jsonl_job, jobs))
 
 
 def load_parser_outputs(path: Path) -> Tuple[List[ParserOutput], List[dict]]:
     return load_jsonl(path, ParserOutput)
 
 
+def iter_parser_outputs(path: Path, batch_size: int = 4096) -> Iterator[List[ParserOutput]]:
+    # stream parser outputs in batches so consumers that only need one pass
+    # can overlap decode with their own work and keep memory at O(batch)
+    batch = []
+    for output in iter_jsonl(path, ParserOutput):
+        batch.append(output)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def load_journals(path: Path) -> Tuple[List[JournalEntry], List[dict]]:
     return load_jsonl(path, JournalEntry)
 
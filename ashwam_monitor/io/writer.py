@@ -3,6 +3,12 @@ from pathlib import Path
 from datetime import datetime
 from typing import Any
 
+try:
+    # same optional fast path as io.loader - orjson serializes in C
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..models.outputs import InvariantReport, DriftReport, CanaryReport, SummaryReport
 from ..models.enums import AlertLevel
 
@@ -22,14 +28,28 @@ def to_json_serializable(obj: Any) -> Any:
     return obj
 
 
+def _orjson_default(obj: Any) -> Any:
+    # orjson natively encodes dicts, lists, str enums and datetimes; this
+    # only kicks in for pydantic models (anything else falls back to str)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "value"):
+        return obj.value
+    return str(obj)
+
+
 def write_json_report(report: Any, path: Path) -> None:
     # write a report to json file
     path.parent.mkdir(parents=True, exist_ok=True)
-    
-    data = to_json_serializable(report)
-    
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+
+    if orjson is not None:
+        # hand the report straight to orjson - one C-level walk instead of
+        # the Python-level to_json_serializable pass plus a re-encode
+        path.write_bytes(orjson.dumps(report, default=_orjson_default, option=orjson.OPT_INDENT_2))
+    else:
+        data = to_json_serializable(report)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
 
 
 def write_invariant_report(report: InvariantReport, out_dir: Path) -> Path:
@@ -57,7 +77,7 @@ def write_summary_report(
     out_dir: Path
 ) -> Path:
     # write combined summary report
-    critical = sum(1 for a in invariant.alerts if "CRITICAL" in a)
+    critical = sum(1 for a in invariant.alerts if a.startswith("CRITICAL"))
     if critical > 0 or canary.action.value == "ROLLBACK":
         status = "CRITICAL"
     elif invariant.hallucination_rate > 0.05:
@@ -89,7 +109,7 @@ def write_summary_report(
             "precision": canary.precision,
             "recall": canary.recall
         },
-        critical_alerts=[a for a in invariant.alerts + drift.alerts if "CRITICAL" in a],
+        critical_alerts=[a for a in invariant.alerts + drift.alerts if a.startswith("CRITICAL")],
         recommended_action=action
     )
 
@@ -3,11 +3,17 @@ Logging configuration for ashwam_monitor.
 Provides structured logging with file and console output.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
+# listener from the previous setup_logging call, stopped before rewiring
+_listener: QueueListener = None
+
 
 def setup_logging(
     log_dir: Path = None,
@@ -25,13 +31,18 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    global _listener
+
     if verbose:
         level = logging.DEBUG
-    
+
     logger = logging.getLogger("ashwam_monitor")
     logger.setLevel(level)
-    
-    # Clear existing handlers
+
+    # Clear existing handlers (and the listener feeding the old file handler)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
     logger.handlers.clear()
     
     # Console handler
@@ -57,13 +68,31 @@ def setup_logging(
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
-        
+
+        # decouple callers from the write syscall: log records go onto an
+        # in-memory queue and a background listener thread drains them into
+        # the file handler, so hot loops never block on disk
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_stop_listener)
+
         logger.info(f"Logging to file: {log_file}")
     
     return logger
 
 
+def _stop_listener():
+    # flush and stop the background listener; safe to call more than once
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def get_logger(name: str = None) -> logging.Logger:
     """
     Get a child logger for a specific module.
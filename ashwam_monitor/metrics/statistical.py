@@ -1,31 +1,142 @@
+import math
+from collections import Counter
+from functools import lru_cache
+
 import numpy as np
-from scipy import stats
-from scipy.stats import entropy
 from typing import List, Tuple, Dict
 
+# below this many bins plain-float arithmetic beats numpy: array
+# construction and ufunc dispatch cost more than the handful of logs, and
+# the drift distributions are all 4-8 categories
+_SCALAR_MAX_BINS = 8
+
+# scipy is imported inside ks_test / chi_squared_test instead of here: the
+# scipy.stats import costs a few hundred ms cold, and CLI paths that only
+# need JSD (pure numpy since the fused rewrite) shouldn't pay it
+
+
+def _jsd_scalar(p, q) -> float:
+    # small-bin specialization of jensen_shannon_divergence: same math on
+    # plain floats with math.log, skipping numpy entirely
+    k = len(p)
+    sp = 0.0
+    sq = 0.0
+    for i in range(k):
+        sp += p[i]
+        sq += q[i]
+    if sp == 0:
+        p = [1.0] * k
+        sp = float(k)
+    if sq == 0:
+        q = [1.0] * k
+        sq = float(k)
+
+    log = math.log
+    total = 0.0
+    for i in range(k):
+        a = p[i] / sp
+        b = q[i] / sq
+        m = 0.5 * (a + b)
+        if a > 0:
+            total += a * log(a / m)
+        if b > 0:
+            total += b * log(b / m)
+    return 0.5 * total
+
 
 def jensen_shannon_divergence(p: List[float], q: List[float]) -> float:
     # symmetric measure of distribution divergence, returns 0 to 1 where 0 is identical
-    p = np.asarray(p, dtype=float)
-    q = np.asarray(q, dtype=float)
+    # one fused pass: scipy.stats.entropy twice meant two normalizations and
+    # two log calls; stacking p and q takes a single np.log over both rows.
+    # zeros are masked out instead of clipped to 1e-10, so they contribute
+    # exactly 0 rather than a fabricated term that still costs a log
+    if len(p) == len(q) and len(p) <= _SCALAR_MAX_BINS:
+        return _jsd_scalar(p, q)
+
+    pq = np.stack([np.asarray(p, dtype=float), np.asarray(q, dtype=float)])
+    totals = pq.sum(axis=1, keepdims=True)
+    if not totals.all():
+        # an all-zero side normalized to uniform under the old clip; keep that
+        pq[totals[:, 0] == 0] = 1.0 / pq.shape[1]
+        totals = pq.sum(axis=1, keepdims=True)
+    pq /= totals
+    m = pq.mean(axis=0)
+    ratio = np.divide(pq, m, out=np.ones_like(pq), where=pq > 0)
+    return float(0.5 * (pq * np.log(ratio)).sum())
+
+
+@lru_cache(maxsize=256)
+def _entropy_of_tuple(dist: Tuple[float, ...]) -> float:
+    # shannon entropy of an already-normalized distribution. tuple-keyed so
+    # a side that repeats across calls - the baseline in a drift run - only
+    # pays for its logs once
+    if len(dist) <= _SCALAR_MAX_BINS:
+        log = math.log
+        return -sum(v * log(v) for v in dist if v > 0)
+    arr = np.asarray(dist)
+    nz = arr[arr > 0]
+    return float(-(nz * np.log(nz)).sum())
+
+
+@lru_cache(maxsize=1024)
+def jsd_from_distributions(p_t: Tuple[float, ...], q_t: Tuple[float, ...]) -> float:
+    # JSD via the identity H((p+q)/2) - (H(p) + H(q))/2, for callers holding
+    # normalized tuples: each side's entropy term memoizes independently, so
+    # only the mixture costs fresh logs when one side is reused. the full
+    # result caches on the pair as well - a repeated baseline/current
+    # comparison (same day re-analyzed, unchanged distributions) skips the
+    # transcendental work entirely, and exactly, where a log lookup table
+    # would only approximate it
+    m_t = tuple(0.5 * (a + b) for a, b in zip(p_t, q_t))
+    js = _entropy_of_tuple(m_t) - 0.5 * (_entropy_of_tuple(p_t) + _entropy_of_tuple(q_t))
+    return max(0.0, js)  # identity can go ~-1e-16 under floating point
 
-    p = np.clip(p, 1e-10, None)
-    q = np.clip(q, 1e-10, None)
 
-    p = p / p.sum()
-    q = q / q.sum()
+import warnings
 
-    m = 0.5 * (p + q)
-    return float(0.5 * (entropy(p, m) + entropy(q, m)))
+# above this combined sample size scipy switches to the asymptotic formula
+# anyway, so the direct numpy path gives the same answer without scipy's
+# exact/asymptotic branching and per-call overhead
+_KS_ASYMP_MIN = 5000
+
+
+def _ks_2samp_asymp(a: np.ndarray, b: np.ndarray) -> Tuple[float, float]:
+    # asymptotic two-sample KS: max CDF gap via two searchsorted passes over
+    # the pooled sorted values, p-value from the kolmogorov series
+    # 2*sum((-1)^(k-1) * exp(-2 k^2 x^2))
+    a = np.sort(a)
+    b = np.sort(b)
+    n1 = a.size
+    n2 = b.size
+    pooled = np.concatenate([a, b])
+    d = float(np.abs(np.searchsorted(a, pooled, side="right") / n1
+                     - np.searchsorted(b, pooled, side="right") / n2).max())
+
+    x = np.sqrt(n1 * n2 / (n1 + n2)) * d
+    if x < 0.2:
+        # the truncated alternating series cancels to 0 as x -> 0 (at d=0
+        # every term is +-1), but the kolmogorov cdf is ~0 there, so the
+        # true p-value is 1 - identical samples must not read as drift
+        return d, 1.0
+    k = np.arange(1, 101)
+    pval = 2.0 * float((np.where(k % 2 == 1, 1.0, -1.0) * np.exp(-2.0 * k * k * x * x)).sum())
+    return d, min(1.0, max(0.0, pval))
 
 
-import warnings
-
 def ks_test(baseline: List[float], current: List[float]) -> Tuple[float, float]:
     # kolmogorov smirnov test, returns (statistic, pvalue), pvalue < 0.05 means significantly different
     if len(baseline) < 2 or len(current) < 2:
         return 0.0, 1.0
 
+    if len(baseline) + len(current) > _KS_ASYMP_MIN:
+        stat, pval = _ks_2samp_asymp(
+            np.asarray(baseline, dtype=np.float64),
+            np.asarray(current, dtype=np.float64)
+        )
+        return stat, pval
+
+    from scipy import stats  # cached after first call
+
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         stat, pval = stats.ks_2samp(baseline, current)
@@ -34,7 +145,9 @@ def ks_test(baseline: List[float], current: List[float]) -> Tuple[float, float]:
 
 def chi_squared_test(baseline_counts: Dict[str, int], current_counts: Dict[str, int]) -> Tuple[float, float]:
     # chi squared for categorical distributions, returns (statistic, pvalue)
-    categories = sorted(set(baseline_counts.keys()) | set(current_counts.keys()))
+    # dict.fromkeys union: the statistic is order-invariant, it only needs
+    # observed and expected paired up, so skip the sort and set copies
+    categories = list(dict.fromkeys((*baseline_counts, *current_counts)))
 
     observed = [current_counts.get(c, 0) for c in categories]
     expected = [baseline_counts.get(c, 0) for c in categories]
@@ -54,6 +167,7 @@ def chi_squared_test(baseline_counts: Dict[str, int], current_counts: Dict[str,
     obs = [v[0] for v in valid]
     exp = [v[1] for v in valid]
 
+    from scipy import stats  # cached after first call
     stat, pval = stats.chisquare(obs, exp)
     return float(stat), float(pval)
 
@@ -63,11 +177,8 @@ def compute_distribution(items: List, key_fn) -> Dict[str, float]:
     if not items:
         return {}
 
-    counts = {}
-    for item in items:
-        k = key_fn(item)
-        if k is not None:
-            counts[k] = counts.get(k, 0) + 1
+    # Counter counts at C level instead of a python-level get/+1 per item
+    counts = Counter(k for k in map(key_fn, items) if k is not None)
 
     total = sum(counts.values())
     if total == 0:
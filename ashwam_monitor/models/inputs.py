@@ -1,3 +1,6 @@
+import sys
+from functools import cached_property
+
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 from .enums import Domain, Polarity
@@ -27,6 +30,21 @@ class ParserItem(BaseModel):
             raise ValueError(f"bad arousal bucket: {v}")
         return v
 
+    @field_validator("time_bucket", "intensity_bucket", "arousal_bucket")
+    @classmethod
+    def intern_categorical(cls, v):
+        # tiny fixed vocabulary but json mints a fresh str per occurrence -
+        # intern so repeated values share one object and counter lookups
+        # short-circuit on identity
+        return sys.intern(v) if v is not None else v
+
+    @cached_property
+    def span_key(self) -> str:
+        # normalized evidence span, interned and computed once per item -
+        # the invariant checks all key on this, so sharing one interned
+        # string gives them pointer-identity hashing with no re-allocation
+        return sys.intern(self.evidence_span.lower().strip())
+
 
 class ParserOutput(BaseModel):
     journal_id: str
@@ -49,6 +67,12 @@ class GoldItem(BaseModel):
     intensity_bucket: Optional[str] = None
     arousal_bucket: Optional[str] = None
 
+    @field_validator("time_bucket", "intensity_bucket", "arousal_bucket")
+    @classmethod
+    def intern_categorical(cls, v):
+        # same interning as ParserItem so parser/gold comparisons stay cheap
+        return sys.intern(v) if v is not None else v
+
 
 class GoldLabel(BaseModel):
     journal_id: str
@@ -11,6 +11,8 @@ class InvariantViolation(BaseModel):
     violation_type: str
     details: str
     severity: AlertLevel
+    # span carried as a field so consumers dont re-parse it out of details
+    evidence_span: Optional[str] = None
 
 
 class InvariantDefinition(BaseModel):
@@ -5,6 +5,7 @@ Stores historical monitoring runs for trend analysis.
 
 import sqlite3
 import json
+import zlib
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -44,11 +45,19 @@ class RunHistoryDB:
         
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # one long-lived connection instead of a connect/teardown per call.
+        # WAL + NORMAL sync keeps writes durable across process crashes while
+        # skipping the fsync-per-transaction of the rollback journal
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
         self._init_db()
-    
+
     def _init_db(self):
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS runs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -81,11 +90,21 @@ class RunHistoryDB:
             """)
             
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_runs_timestamp 
+                CREATE INDEX IF NOT EXISTS idx_runs_timestamp
                 ON runs(timestamp)
             """)
-            
-            conn.commit()
+
+            # alert queries filter on timestamp (summaries) and on
+            # run_id/severity (per-run drilldowns); both were full scans
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_alerts_timestamp
+                ON alerts(timestamp)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_alerts_run_severity
+                ON alerts(run_id, severity)
+            """)
     
     def save_run(
         self,
@@ -116,9 +135,10 @@ class RunHistoryDB:
         
         # Count alerts
         all_alerts = invariant_report.alerts + drift_report.alerts
-        critical_count = sum(1 for a in all_alerts if "CRITICAL" in a)
+        critical_count = sum(1 for a in all_alerts if a.startswith("CRITICAL"))
         
-        with sqlite3.connect(self.db_path) as conn:
+        now = datetime.now().isoformat()
+        with self._conn as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO runs (
                     run_id, timestamp, data_source,
@@ -130,7 +150,7 @@ class RunHistoryDB:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 run_id,
-                datetime.now().isoformat(),
+                now,
                 data_source,
                 invariant_report.hallucination_rate,
                 invariant_report.contradiction_rate,
@@ -142,26 +162,44 @@ class RunHistoryDB:
                 canary_report.action.value if canary_report else None,
                 len(all_alerts),
                 critical_count,
-                json.dumps({
+                # compressed blob: the report tree is repetitive json that
+                # zlib level 1 shrinks ~10x, keeping runs-table pages small
+                zlib.compress(json.dumps({
                     "invariant": invariant_report.model_dump() if hasattr(invariant_report, 'model_dump') else {},
                     "drift": drift_report.model_dump() if hasattr(drift_report, 'model_dump') else {}
-                }, default=str)
+                }, default=str).encode("utf-8"), 1)
             ))
             
-            # Save alerts
-            for alert in all_alerts:
-                severity = "CRITICAL" if "CRITICAL" in alert else "WARNING"
-                conn.execute("""
+            # Save alerts in one batch statement instead of a round trip each
+            if all_alerts:
+                conn.executemany("""
                     INSERT INTO alerts (run_id, severity, message, timestamp)
                     VALUES (?, ?, ?, ?)
-                """, (run_id, severity, alert, datetime.now().isoformat()))
-            
-            conn.commit()
+                """, [
+                    (run_id,
+                     "CRITICAL" if alert.startswith("CRITICAL") else "WARNING",
+                     alert,
+                     now)
+                    for alert in all_alerts
+                ])
     
+    def get_full_report(self, run_id: str) -> Optional[Dict]:
+        """Get the stored report tree for a run, or None if not found."""
+        with self._conn as conn:
+            row = conn.execute(
+                "SELECT full_report FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        blob = row[0]
+        if isinstance(blob, str):
+            # rows written before compression landed are plain json text
+            return json.loads(blob)
+        return json.loads(zlib.decompress(blob))
+
     def get_recent_runs(self, limit: int = 10) -> List[Dict]:
         """Get the most recent runs."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._conn as conn:
             cursor = conn.execute("""
                 SELECT run_id, timestamp, data_source,
                        hallucination_rate, contradiction_rate,
@@ -172,26 +210,43 @@ class RunHistoryDB:
             """, (limit,))
             return [dict(row) for row in cursor.fetchall()]
     
+    # columns get_trend may select - column names cannot be bound as
+    # parameters, so interpolation is gated on this whitelist
+    TREND_METRICS = frozenset({
+        "hallucination_rate", "contradiction_rate",
+        "schema_validity_rate", "evidence_validity_rate",
+        "extraction_volume", "uncertainty_rate",
+        "canary_f1", "alert_count", "critical_count"
+    })
+
     def get_trend(self, metric: str, days: int = 7) -> List[Dict]:
         """Get trend data for a specific metric over the last N days."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        if metric not in self.TREND_METRICS:
+            raise ValueError(f"unknown trend metric: {metric}")
+
+        with self._conn as conn:
             cursor = conn.execute(f"""
                 SELECT timestamp, {metric} as value
                 FROM runs
-                WHERE timestamp >= datetime('now', '-{days} days')
+                WHERE timestamp >= datetime('now', ?)
                 ORDER BY timestamp ASC
-            """)
+            """, (f"-{int(days)} days",))
             return [dict(row) for row in cursor.fetchall()]
     
     def get_alert_summary(self, days: int = 7) -> Dict:
         """Get alert summary for the last N days."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
+            # the old '-? days' put the placeholder inside a string literal,
+            # so it never bound and the cutoff silently matched nothing
             cursor = conn.execute("""
                 SELECT severity, COUNT(*) as count
                 FROM alerts
-                WHERE timestamp >= datetime('now', '-? days')
+                WHERE timestamp >= datetime('now', ?)
                 GROUP BY severity
-            """, (days,))
+            """, (f"-{int(days)} days",))
             results = cursor.fetchall()
             return {row[0]: row[1] for row in results}
+
+    def close(self):
+        """Close the underlying connection."""
+        self._conn.close()
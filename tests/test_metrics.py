@@ -44,43 +44,58 @@ class TestKSTest:
         stat, pval = ks_test(a, b)
         assert pval < 0.05  # significantly different
 
+    def test_identical_samples_above_asymptotic_cutoff(self):
+        # large enough to take the asymptotic path; an identical pair must
+        # come back p=1.0, not the degenerate 0.0 of the raw series at d=0
+        a = [i / 3000 for i in range(3000)]
+        stat, pval = ks_test(a, list(a))
+        assert stat == 0.0
+        assert pval == 1.0
+
+
+def make_item(domain, confidence=0.7, intensity="medium", arousal=None):
+    # model_construct skips validation - every field here is a literal
+    # known-good value, so the tests don't pay the validator machinery
+    return ParserItem.model_construct(
+        domain=domain,
+        text="test",
+        evidence_span="test span",
+        polarity=Polarity.PRESENT,
+        time_bucket="today",
+        intensity_bucket=intensity,
+        arousal_bucket=arousal,
+        confidence=confidence
+    )
 
-class TestExtractors:
 
-    def make_item(self, domain, confidence=0.7, intensity="medium", arousal=None):
-        return ParserItem(
-            domain=domain,
-            text="test",
-            evidence_span="test span",
-            polarity=Polarity.PRESENT,
-            time_bucket="today",
-            intensity_bucket=intensity,
-            arousal_bucket=arousal,
-            confidence=confidence
-        )
-
-    def test_uncertainty_rate_low_confidence(self):
-        items = [
-            self.make_item(Domain.SYMPTOM, confidence=0.3),
-            self.make_item(Domain.SYMPTOM, confidence=0.8),
-        ]
-        rate = compute_uncertainty_rate(items)
-        assert rate == 0.5  # 1 low confidence out of 2
+class TestExtractors:
 
-    def test_uncertainty_rate_unknown_intensity(self):
+    @pytest.mark.parametrize("uncertain_kwargs,certain_kwargs", [
+        pytest.param(
+            {"domain": Domain.SYMPTOM, "confidence": 0.3},
+            {"domain": Domain.SYMPTOM, "confidence": 0.8},
+            id="low_confidence"
+        ),
+        pytest.param(
+            {"domain": Domain.FOOD, "intensity": "unknown"},
+            {"domain": Domain.FOOD, "intensity": "medium"},
+            id="unknown_intensity"
+        ),
+    ])
+    def test_uncertainty_rate(self, uncertain_kwargs, certain_kwargs):
         items = [
-            self.make_item(Domain.FOOD, intensity="unknown"),
-            self.make_item(Domain.FOOD, intensity="medium"),
+            make_item(**uncertain_kwargs),
+            make_item(**certain_kwargs),
         ]
         rate = compute_uncertainty_rate(items)
-        assert rate == 0.5
+        assert rate == 0.5  # 1 uncertain out of 2
 
     def test_domain_distribution(self):
         items = [
-            self.make_item(Domain.SYMPTOM),
-            self.make_item(Domain.SYMPTOM),
-            self.make_item(Domain.FOOD),
-            self.make_item(Domain.EMOTION, arousal="high"),
+            make_item(Domain.SYMPTOM),
+            make_item(Domain.SYMPTOM),
+            make_item(Domain.FOOD),
+            make_item(Domain.EMOTION, arousal="high"),
         ]
         dist = compute_domain_distribution(items)
         assert dist["symptom"] == 0.5
@@ -90,12 +105,12 @@ class TestExtractors:
     def test_extraction_volume(self):
         outputs = [
             ParserOutput(journal_id="C001", items=[
-                self.make_item(Domain.SYMPTOM),
-                self.make_item(Domain.FOOD)
+                make_item(Domain.SYMPTOM),
+                make_item(Domain.FOOD)
             ]),
             ParserOutput(journal_id="C002", items=[]),
             ParserOutput(journal_id="C003", items=[
-                self.make_item(Domain.EMOTION, arousal="low")
+                make_item(Domain.EMOTION, arousal="low")
             ]),
         ]
         vol = compute_extraction_volume(outputs)